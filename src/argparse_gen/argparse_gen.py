@@ -2,26 +2,78 @@
 Argparse code generator.
 """
 
-import importlib
-import importlib.util
+from functools import lru_cache
 import inspect
 import operator
 from pathlib import Path
 import re
 import sys
-import textwrap
 from types import ModuleType
-from typing import Self, Any
+from typing import Any, ClassVar, Self
 
 from .param_def import ParamDef
 
 
+_UNSET: Any = object()
+
+_ALLOWED_KINDS = frozenset({
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+})
+
+_CODE_SHEBANG = "#!/usr/bin/python3\n"
+_CODE_IMPORTS = "import argparse\nimport sys"
+_CODE_PARSER = """
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=sys.modules[__name__].__doc__,
+    )"""
+_CODE_PARSE_ARGS = "\n    args = parser.parse_args()\n"
+
+
+def _is_anchored(pattern: str) -> bool:
+    """
+    Return `True` if every match of `pattern` must start at string's start.
+
+    Patterns with alternations are never treated as anchored, as `^` might
+    apply to some of their branches only.
+    """
+    return pattern.startswith("^") and "|" not in pattern
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Return the literal text that every match of anchored `pattern` starts with.
+
+    An empty string is returned if no such prefix can be safely determined.
+    """
+    if not _is_anchored(pattern):
+        return ""
+    prefix = ""
+    for char in pattern[1:]:
+        if char in ".^$*+?{}[]()\\":
+            if char in "*?{":
+                prefix = prefix[:-1]
+            break
+        prefix += char
+    return prefix
+
+
+def _param_name_len(param_def: ParamDef) -> int:
+    """
+    Return the length of the name of `param_def`'s parameter.
+    """
+    return len(param_def.param.name)
+
+
 class ArgparseGen:
     """
     Argparse code generator.
     """
 
-    module_name_base = "argparse_gen_load"
+    module_name_base: ClassVar[str] = "argparse_gen_load"
 
     def __init__(
         self,
@@ -55,10 +107,26 @@ class ArgparseGen:
         """
         self.module = module
         self.obj_name = obj_name
-        self.param_re = re.compile(param_regex)
+        self.param_re = self._compile_regex(param_regex)
+        self._param_find = (
+            self.param_re.match
+            if _is_anchored(param_regex) else
+            self.param_re.search
+        )
+        self._param_prefix = _literal_prefix(param_regex)
         self.indent = indent
         self.skip_private = skip_private
         self.use_call_args = use_call_args
+        self._resolved_obj: Any = _UNSET
+        self._params_cache: list[ParamDef] | None = None
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _compile_regex(pattern: str) -> re.Pattern[str]:
+        """
+        Return compiled `pattern`, shared between instances.
+        """
+        return re.compile(pattern)
 
     @classmethod
     def _get_name(cls, name: str | None = None) -> str:
@@ -86,6 +154,9 @@ class ArgparseGen:
         """
         Return an `ArgparseGen` instance from a module file or a package dir.
         """
+        import importlib
+        import importlib.util
+
         module: ModuleType
         path = (
             module_path
@@ -93,8 +164,15 @@ class ArgparseGen:
             Path(module_path)
         )
         if path.is_dir():
-            sys.path.insert(0, str(path.parent))
-            module = importlib.import_module(path.stem)
+            parent = str(path.parent)
+            extend_path = parent not in sys.path
+            if extend_path:
+                sys.path.insert(0, parent)
+            try:
+                module = importlib.import_module(path.stem)
+            finally:
+                if extend_path:
+                    sys.path.remove(parent)
         else:
             module_name = cls._get_name(path.stem)
             spec = importlib.util.spec_from_file_location(module_name, path)
@@ -127,14 +205,8 @@ class ArgparseGen:
         """
         Return an `ArgparseGen` instance from a module as a source string.
         """
-        spec = importlib.util.spec_from_loader(cls._get_name(), loader=None)
-        if spec is not None:
-            module = importlib.util.module_from_spec(spec)
-            exec(source, module.__dict__)
-            if spec.loader is not None:
-                spec.loader.exec_module(module)
-        else:
-            raise RuntimeError("failed to create module spec")
+        module = ModuleType(cls._get_name())
+        exec(source, module.__dict__)
         return cls(
             module,
             obj_name=obj_name,
@@ -148,7 +220,11 @@ class ArgparseGen:
         """
         Return object to call from CLI.
         """
-        return operator.attrgetter(self.obj_name)(self.module)
+        if self._resolved_obj is _UNSET:
+            self._resolved_obj = operator.attrgetter(self.obj_name)(
+                self.module,
+            )
+        return self._resolved_obj
 
     def _get_help_dict(self, obj: Any) -> dict[str, str]:
         """
@@ -156,26 +232,34 @@ class ArgparseGen:
         """
         result: dict[str, str] = dict()
         curr_name = ""
-        curr_help = ""
+        curr_help_parts: list[str] = list()
 
         def save_current() -> None:
-            nonlocal result, curr_name, curr_help
-            if curr_name and curr_help:
-                result[curr_name] = curr_help
+            nonlocal result, curr_name, curr_help_parts
+            if curr_name:
+                curr_help = " ".join(part for part in curr_help_parts if part)
+                if curr_help:
+                    result[curr_name] = curr_help
 
         if not obj.__doc__:
             return result
 
-        for line in obj.__doc__.split("\n"):
+        for line in obj.__doc__.splitlines():
             line = line.strip()
             if not line:
                 save_current()
-            elif m := self.param_re.search(line):
+            elif (
+                (
+                    not self._param_prefix
+                    or line.startswith(self._param_prefix)
+                )
+                and (m := self._param_find(line))
+            ):
                 save_current()
                 curr_name = m.group("name")
-                curr_help = line[m.end() - m.start():]
+                curr_help_parts = [line[m.end():]]
             elif curr_name:
-                curr_help += ("" if curr_help.endswith(" ") else " ") + line
+                curr_help_parts.append(line)
         save_current()
 
         if inspect.isclass(obj):
@@ -191,96 +275,87 @@ class ArgparseGen:
     def as_list(self) -> list[ParamDef]:
         """
         Return arguments for `ArgumentParser` as list of `ParamDef` instances.
+
+        The parameters are analysed only on the first call, so changing
+        `module`, `obj_name` or `skip_private` afterwards has no effect.
         """
+        if self._params_cache is not None:
+            return list(self._params_cache)
         obj = self._get_obj()
         helps = self._get_help_dict(obj)
-        single_chars: set[str] = set()
         result = [
             ParamDef(param, helps.get(param.name))
             for param in inspect.signature(obj).parameters.values()
             if (
                 not (self.skip_private and param.name.startswith("_"))
-                and param.kind in {
-                    inspect.Parameter.POSITIONAL_ONLY,
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    inspect.Parameter.KEYWORD_ONLY,
-                }
+                and param.kind in _ALLOWED_KINDS
             )
         ]
-        for param_def in sorted(
-            result, key=lambda param_def: len(param_def.param.name),
-        ):
+        # Single-letter options are reserved upfront, so that short forms of
+        # longer names cannot take them regardless of processing order.
+        single_chars = {
+            param_def.param.name
+            for param_def in result
+            if (
+                len(param_def.param.name) == 1
+                and param_def.param.kind
+                is not inspect.Parameter.POSITIONAL_ONLY
+            )
+        }
+        for param_def in sorted(result, key=_param_name_len):
             param_def.set_names(single_chars)
-        return result
+        self._params_cache = result
+        return list(result)
 
     def as_args(self) -> str:
         """
         Return arguments for `obj(...)` call as a string.
         """
+        return self._as_args_from_list(self.as_list())
+
+    @staticmethod
+    def _as_args_from_list(params: list[ParamDef]) -> str:
+        """
+        Return arguments for `obj(...)` call for `params` as a string.
+        """
         return "".join(
             f"        {param_def.as_arg()},\n"  # noqa: E231
-            for param_def in self.as_list()
+            for param_def in params
         )
 
     def as_code(self) -> str:
         """
         Return full code for CLI script to use `obj`.
         """
-        lines = [
-            "#!/usr/bin/python3",
-            "",
-        ]
+        import textwrap
+
+        lines: list[str] = [_CODE_SHEBANG]
         try:
             doc = self._get_obj().__doc__.strip().splitlines()[0].strip()
         except (AttributeError, IndexError):
             pass
         else:
-            lines.extend([
-                "'''",
-                doc,
-                "'''",
-                "",
-            ])
-        lines.extend([
-            "import argparse",
-            "import sys",
-        ])
+            lines.append(f"'''\n{doc}\n'''\n")
+        lines.append(_CODE_IMPORTS)
         if self.use_call_args:
-            lines.extend([
-                "",
-                "from call_args import call_args_attr",
-            ])
+            lines.append("\nfrom call_args import call_args_attr")
         module_name = self.module.__name__
         use_module = module_name and not module_name.startswith("__")
         if use_module:
-            lines.extend([
-                "",
-                f"import {self.module.__name__}",
-            ])
-        lines.extend(
-            [
-                "",
-                "",
-                "if __name__ == '__main__':",
-                "    parser = argparse.ArgumentParser(",
-                "        description=sys.modules[__name__].__doc__,",
-                "    )",
-            ]
-            + [
-                textwrap.indent(param_def.as_code(), "    ")
-                for param_def in self.as_list()
-            ]
-            + [
-                "",
-                "    args = parser.parse_args()",
-                "",
-            ],
-        )
-        prefix = f"{self.module.__name__}." if use_module else ""
+            lines.append(f"\nimport {module_name}")
+        lines.append(_CODE_PARSER)
+        params = self.as_list()
+        for param_def in params:
+            lines.append(textwrap.indent(param_def.as_code(), "    "))
+        lines.append(_CODE_PARSE_ARGS)
+        prefix = f"{module_name}." if use_module else ""
         obj_name = self.obj_name
-        lines.append(
-            f"    call_args_attr({prefix}{obj_name}, args)"
-            if self.use_call_args else
-            f"    {prefix}{obj_name}(\n{self.as_args()}    )"  # noqa: E202
-        )
-        return textwrap.indent("\n".join(lines), self.indent)
+        if self.use_call_args:
+            lines.append(f"    call_args_attr({prefix}{obj_name}, args)")
+        else:
+            call_args = self._as_args_from_list(params)
+            lines.append(
+                f"    {prefix}{obj_name}(\n{call_args}    )",  # noqa: E202
+            )
+        code = "\n".join(lines)
+        return textwrap.indent(code, self.indent) if self.indent else code
@@ -6,12 +6,84 @@ Argparse code generator.
 
 import argparse
 import sys
+from typing import Any
 
 # from call_args import call_args_attr
 
 import argparse_gen.argparse_gen
 
 
+_ARGS_SPEC: list[tuple[tuple[str, ...], dict[str, Any]]] = [
+    (
+        ("module_file",),
+        {
+            "type": str,
+            "help": (
+                "A .py file of the module containing the callable to be"
+                " invoked with CLI arguments."
+            ),
+        },
+    ),
+    (
+        ("obj_name",),
+        {
+            "type": str,
+            "help": (
+                "The name of the callable in `module` for which we\"re"
+                ' building a CLI interface. This may contain "paths" (like'
+                ' `"foo.bar"`).'
+            ),
+        },
+    ),
+    (
+        ("-p", "--param_regex"),
+        {
+            "default": "^:param\\s+(?P<name>\\w+):\\s*",
+            "type": str,
+            "help": (
+                "A regular expression to recognise parameters in the"
+                " callable's docstring. The default recognizes rST"
+                " (reStructuredText) format."
+            ),
+        },
+    ),
+    (
+        ("-i", "--indent"),
+        {
+            "default": "",
+            "type": str,
+            "help": "Additional indentation for the generated code.",
+        },
+    ),
+    (
+        ("-s", "--skip_private"),
+        {
+            "default": True,
+            "action": "store_false",
+            "help": (
+                "Skip private (those with names starting with an underscore)"
+                " arguments."
+            ),
+        },
+    ),
+    (
+        ("-c", "--call_args"),
+        {
+            "default": False,
+            "dest": "use_call_args",
+            "action": "store_true",
+            "help": (
+                "Instead of generating a call with all of the available"
+                " arguments, use `call_args` (from the"
+                " [`call-args`](https://pypi.org/project/call-args/)"
+                " package). This loses some transparency, but it's quite"
+                " convenient if you frequently change the arguments."
+            ),
+        },
+    ),
+]
+
+
 def main() -> int:
     """
     Argparse code generator.
@@ -19,64 +91,8 @@ def main() -> int:
     parser = argparse.ArgumentParser(
         description=sys.modules[__name__].__doc__,
     )
-    parser.add_argument(
-        "module_file",
-        type=str,
-        help=(
-            "A .py file of the module containing the callable to be invoked"
-            " with CLI arguments."
-        ),
-    )
-    parser.add_argument(
-        "obj_name",
-        type=str,
-        help=(
-            "The name of the callable in `module` for which we\"re building"
-            ' a CLI interface. This may contain "paths" (like `"foo.bar"`).'
-        ),
-    )
-    parser.add_argument(
-        "-p",
-        "--param_regex",
-        default="^:param\\s+(?P<name>\\w+):\\s*",
-        type=str,
-        help=(
-            "A regular expression to recognise parameters in the callable's"
-            " docstring. The default recognizes rST (reStructuredText)"
-            " format."
-        ),
-    )
-    parser.add_argument(
-        "-i",
-        "--indent",
-        default="",
-        type=str,
-        help="Additional indentation for the generated code.",
-    )
-    parser.add_argument(
-        "-s",
-        "--skip_private",
-        default=True,
-        action="store_false",
-        help=(
-            "Skip private (those with names starting with an underscore)"
-            " arguments."
-        ),
-    )
-    parser.add_argument(
-        "-c",
-        "--call_args",
-        default=False,
-        dest="use_call_args",
-        action="store_true",
-        help=(
-            "Instead of generating a call with all of the available"
-            " arguments, use `call_args` (from the"
-            " [`call-args`](https://pypi.org/project/call-args/) package)."
-            " This loses some transparency, but it's quite convenient if you"
-            " frequently change the arguments."
-        ),
-    )
+    for names, kwargs in _ARGS_SPEC:
+        parser.add_argument(*names, **kwargs)
 
     args = parser.parse_args()
 
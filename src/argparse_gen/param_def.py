@@ -1,17 +1,68 @@
 import enum
 import inspect
 import operator
-from typing import Any, get_args, Literal
+from typing import Any, Callable, ClassVar, get_args, Literal
 
 from .utils import EnumValue, EnumType, str_as_arg
 
 
+_AnnotationResult = tuple[type | EnumType | None, tuple[Any, ...] | None]
+
+
+def _handle_literal(
+    annotation: Any, result: dict[str, Any],
+) -> _AnnotationResult:
+    """
+    Return type and choices for a `Literal[...]` annotation.
+    """
+    choices = get_args(annotation)
+    param_types = {type(literal) for literal in choices}
+    param_type = param_types.pop() if len(param_types) == 1 else None
+    return param_type, choices
+
+
+def _handle_enum(
+    annotation: Any, result: dict[str, Any],
+) -> _AnnotationResult:
+    """
+    Return type and choices for an `enum.Enum` annotation.
+    """
+    choices = tuple(EnumValue(enum_value) for enum_value in annotation)
+    try:
+        result["default"] = EnumValue(result["default"])
+    except KeyError:
+        pass
+    return EnumType(annotation), choices
+
+
+def _handle_plain_type(
+    annotation: Any, result: dict[str, Any],
+) -> _AnnotationResult:
+    """
+    Return type and choices for any annotation not in the dispatch table.
+    """
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            # Enums with a custom metaclass.
+            return _handle_enum(annotation, result)
+        return annotation, None
+    return None, None
+
+
+_ANNOTATION_HANDLERS: dict[
+    type, Callable[[Any, dict[str, Any]], _AnnotationResult],
+] = {
+    type(Literal["1", "2"]): _handle_literal,
+    enum.EnumMeta: _handle_enum,
+}
+
+
 class ParamDef:
     """
     One parameter definition.
     """
 
-    _repr_f = {
+    _repr_f: ClassVar[dict[str, Callable[[Any], str]]] = {
         "type": operator.attrgetter("__name__"),
     }
 
@@ -23,11 +74,21 @@ class ParamDef:
         self.param = param
         self.names: list[str] = list()
         self.help_str = help_str
+        self._dict_cache: dict[str, Any] | None = None
+        self._repr_dict_cache: dict[str, str] | None = None
 
     def set_names(self, single_chars: set[str]) -> None:
         """
         Update `self.names`.
+
+        `single_chars` holds short option letters that are already taken; the
+        one chosen for this parameter, if any, is added to it.
+
+        This invalidates cached results of :py:meth:`as_dict` and
+        :py:meth:`as_repr_dict`.
         """
+        self._dict_cache = None
+        self._repr_dict_cache = None
         name = self.param.name
         if self.param.kind is inspect.Parameter.POSITIONAL_ONLY:
             self.names = [name]
@@ -47,23 +108,11 @@ class ParamDef:
         """
         Analize param's annotation and update its dictionary representation.
         """
-        param_type: type | EnumType | None = None
-        choices: tuple[Any, ...] | None = None
         annotation = self.param.annotation
-        if type(annotation) is type(Literal["1", "2"]):  # noqa: E721
-            choices = get_args(annotation)
-            param_types = {type(literal) for literal in choices}
-            if len(param_types) == 1:
-                param_type = param_types.pop()
-        elif inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
-            choices = tuple(EnumValue(enum_value) for enum_value in annotation)
-            param_type = EnumType(annotation)
-            try:
-                result["default"] = EnumValue(result["default"])
-            except KeyError:
-                pass
-        elif isinstance(annotation, type):
-            param_type = annotation
+        handler = _ANNOTATION_HANDLERS.get(
+            type(annotation), _handle_plain_type,
+        )
+        param_type, choices = handler(annotation, result)
         if param_type is not None:
             if param_type is bool:
                 result["action"] = (
@@ -80,27 +129,32 @@ class ParamDef:
         """
         Return attributes for :py:meth:`ArgumentParser.add_argument` as a dict.
         """
+        if self._dict_cache is not None:
+            return self._dict_cache
         result: dict[str, Any] = {"names": self.names}
         required = self.param.default is inspect.Parameter.empty
         if self.param.kind == inspect.Parameter.POSITIONAL_ONLY:
             if not required:
                 result["nargs"] = "?"
-        else:
-            result["required"] = required
+        elif required:
+            result["required"] = True
         if not required:
             result["default"] = self.param.default
         self._handle_annotation(result)
         result["help"] = self.help_str or ""
+        self._dict_cache = result
         return result
 
     def as_repr_dict(self) -> dict[str, str]:
         """
         Return attributes as a dict of `repr` strings.
         """
-        return {
-            name: self._repr_f.get(name, repr)(value)
-            for name, value in self.as_dict().items()
-        }
+        if self._repr_dict_cache is None:
+            self._repr_dict_cache = {
+                name: self._repr_f.get(name, repr)(value)
+                for name, value in self.as_dict().items()
+            }
+        return self._repr_dict_cache
 
     def as_code(self) -> str:
         """
@@ -3,7 +3,6 @@ Utility functions for the rest of the package.
 """
 
 import enum
-import textwrap
 from typing import Type
 
 
@@ -14,13 +13,14 @@ class EnumType:
 
     def __init__(self, param_type: Type[enum.Enum]) -> None:
         self.param_type = param_type
+        self._name = f"lambda value: getattr({param_type.__name__}, value)"
 
     @property
     def __name__(self) -> str:
         """
         Return string to be used in :py:meth:`ArgumentParser.add_argument`.
         """
-        return f"lambda value: getattr({self.param_type.__name__}, value)"
+        return self._name
 
 
 class EnumValue:
@@ -30,12 +30,40 @@ class EnumValue:
 
     def __init__(self, value: enum.Enum) -> None:
         self.value = value
+        self._repr = f"{value.__class__.__name__}.{value.name}"
 
     def __repr__(self) -> str:
         """
         Return string to be used in :py:meth:`ArgumentParser.add_argument`.
         """
-        return f"{self.value.__class__.__name__}.{self.value.name}"
+        return self._repr
+
+
+def _greedy_wrap(text: str, width: int) -> list[str]:
+    """
+    Return `text` split on spaces into lines at most `width` characters long.
+
+    Words longer than `width` are not broken, but put in lines of their own.
+    """
+    lines: list[str] = []
+    stripped = text.lstrip(" ")
+    # Leading spaces are kept if the first word fits after them.
+    words = [""] * (len(text) - len(stripped))
+    size = len(words) - 1
+    for word in stripped.split(" "):
+        if words and size + 1 + len(word) > width:
+            line = " ".join(words).rstrip(" ")
+            if line:
+                lines.append(line)
+            words = []
+            size = -1
+        if words or word:
+            words.append(word)
+            size += 1 + len(word)
+    line = " ".join(words).rstrip(" ")
+    if line:
+        lines.append(line)
+    return lines
 
 
 def str_as_arg(name: str, value: str, max_width: int = 72) -> str:
@@ -49,23 +77,11 @@ def str_as_arg(name: str, value: str, max_width: int = 72) -> str:
             raise ValueError(f"non-repr string {value!r}")
         value = value[1:-1]
         lead_size += max(0, 4 - len(name))
-        return (
-            "\n".join(
-                [
-                    f"        {quote} {line}{quote}"
-                    if line_idx else
-                    f"{name}=(\n        {quote}{line}{quote}"
-                    for line_idx, line in enumerate(
-                        textwrap.wrap(
-                            value,
-                            max_width - lead_size - 4,
-                            break_long_words=False,
-                            break_on_hyphens=False,
-                        ),
-                    )
-                ],
-            )
-            + "\n    )"
-        )
+        wrapped = _greedy_wrap(value, max_width - lead_size - 4)
+        if not wrapped:
+            return f"{name}={quote}{value}{quote}"
+        first = f"{name}=(\n        {quote}{wrapped[0]}{quote}"
+        rest = [f"        {quote} {line}{quote}" for line in wrapped[1:]]
+        return "\n".join([first, *rest]) + "\n    )"
     else:
         return f"{name}={value}"